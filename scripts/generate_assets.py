@@ -19,8 +19,10 @@ from src.utils.asset_generator import (
 
 def main():
     """Generate and save all placeholder assets."""
-    # Initialize pygame (required for surface operations)
-    pygame.init()
+    # Only the display subsystem is needed for surface operations; the dummy
+    # video driver lets this run headless (e.g. on CI)
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
     
     print("Generating library assets...")
     save_library_assets()
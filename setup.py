@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Build script for the optional compiled game loop.
+
+This script compiles the main loop modules with Cython. The resulting
+extension modules are placed next to the sources and are imported in their
+place:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Delete the generated extension modules to run the pure-Python sources again.
+"""
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+
+# Modules on the per-frame path of Application.run
+COMPILED_MODULES = [
+    Extension("src.core.application", ["src/core/application.py"]),
+    Extension("src.core.game_clock", ["src/core/game_clock.py"]),
+]
+
+
+setup(
+    name="when-society-falls",
+    ext_modules=cythonize(
+        COMPILED_MODULES,
+        compiler_directives={
+            "language_level": 3,
+            "boundscheck": False,
+            "cdivision": True,
+        },
+    ),
+)
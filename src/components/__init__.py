@@ -9,7 +9,7 @@ from src.components.sprite import Sprite
 from src.components.camera import Camera
 from src.components.tilemap import Tilemap, TileDefinition, TilemapLayer
 from src.components.physics import RigidBody, Collider
-from src.components.player_controller import PlayerController
+from src.components.player_controller import PlayerController, CONTROLLER_FIELDS
 
 __all__ = [
     'Transform',
@@ -21,4 +21,5 @@ __all__ = [
     'RigidBody',
     'Collider',
     'PlayerController',
+    'CONTROLLER_FIELDS',
 ]
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Batch math kernels for components.
+
+This module provides vectorized routines that operate on struct-of-arrays
+buffers, so per-entity math runs once per frame for all entities.
+"""
+import numpy as np
+
+
+def process_controllers(dx, dy, speed, dt, out_mx, out_my):
+    """
+    Compute the movement vectors for a batch of controllers.
+    
+    Directions must already be normalized, as PlayerController.poll_input
+    leaves them; each is scaled by its controller's speed and the frame
+    delta and written to the output arrays. Zero directions produce zero
+    movement.
+    
+    Args:
+        dx: Array of normalized x direction components
+        dy: Array of normalized y direction components
+        speed: Array of movement speeds in pixels per second
+        dt: Delta time in seconds
+        out_mx: Output array for the x movement in pixels
+        out_my: Output array for the y movement in pixels
+    """
+    scale = speed * dt
+    np.multiply(dx, scale, out=out_mx)
+    np.multiply(dy, scale, out=out_my)
@@ -4,13 +4,28 @@ Player controller component for the ECS framework.
 This module provides a component for controlling player entities.
 """
 import logging
-from typing import Tuple, Optional, Callable, Dict, Any
+from typing import Tuple, Optional, Callable, Dict, Any, Sequence, AbstractSet
 import pygame
 from dataclasses import dataclass, field
 
 from src.ecs.component import Component
 
 
+logger = logging.getLogger(__name__)
+
+# Component magnitude of a normalized diagonal direction (1 / sqrt(2))
+_INV_SQRT2 = 0.7071067811865476
+
+# Per-controller fields for batch movement in struct-of-arrays storage
+CONTROLLER_FIELDS = [
+    ('dx', 'f4'),
+    ('dy', 'f4'),
+    ('speed', 'f4'),
+    ('move_x', 'f4'),
+    ('move_y', 'f4'),
+]
+
+
 @dataclass
 class PlayerController(Component):
     """
@@ -50,74 +65,150 @@ class PlayerController(Component):
     def __post_init__(self):
         """Initialize the component after initialization."""
         super().__init__()
-        self.logger = logging.getLogger('PlayerController')
+        self._cache_key_bindings()
     
-    def process_input(self, dt: float, keys_pressed: Dict[int, bool]) -> Tuple[float, float]:
+    def _cache_key_bindings(self) -> None:
+        """Resolve the key bindings once instead of per-frame dict lookups."""
+        self._k_up = self.move_keys['up']
+        self._k_down = self.move_keys['down']
+        self._k_left = self.move_keys['left']
+        self._k_right = self.move_keys['right']
+        self._k_sprint = self.sprint_key
+        self._k_interact = self.interact_key
+        
+        # Keys whose just-pressed state this controller needs
+        self.watched_keys = frozenset((self._k_interact,))
+    
+    def poll_input(self, keys: Optional[Sequence[bool]] = None) -> float:
         """
-        Process input and return the movement vector.
+        Update the movement state from the keyboard.
+        
+        Sets move_direction, facing_direction, is_sprinting and is_moving
+        without applying speed or time scaling, so movement for many
+        controllers can be computed in one batch.
         
         Args:
-            dt: Delta time in seconds
-            keys_pressed: Dictionary of pressed keys
+            keys: Keyboard state from pygame.key.get_pressed(); fetched if
+                not provided
             
         Returns:
-            Tuple containing the x and y movement in pixels
+            Current movement speed in pixels per second, or 0.0 when no
+            movement key is held
         """
-        # Reset movement direction
-        self.move_direction = (0.0, 0.0)
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        
+        up = keys[self._k_up]
+        down = keys[self._k_down]
+        left = keys[self._k_left]
+        right = keys[self._k_right]
+        
+        # Idle fast path; facing_direction keeps its last value
+        if not (up or down or left or right):
+            self.move_direction = (0.0, 0.0)
+            self.is_moving = False
+            self.is_sprinting = False
+            return 0.0
+        
+        dx = 0.0
+        dy = 0.0
         
         # Check movement keys
-        if keys_pressed.get(self.move_keys['up'], False):
-            self.move_direction = (self.move_direction[0], self.move_direction[1] - 1.0)
+        if up:
+            dy -= 1.0
             self.facing_direction = (0.0, -1.0)
-        if keys_pressed.get(self.move_keys['down'], False):
-            self.move_direction = (self.move_direction[0], self.move_direction[1] + 1.0)
+        if down:
+            dy += 1.0
             self.facing_direction = (0.0, 1.0)
-        if keys_pressed.get(self.move_keys['left'], False):
-            self.move_direction = (self.move_direction[0] - 1.0, self.move_direction[1])
+        if left:
+            dx -= 1.0
             self.facing_direction = (-1.0, 0.0)
-        if keys_pressed.get(self.move_keys['right'], False):
-            self.move_direction = (self.move_direction[0] + 1.0, self.move_direction[1])
+        if right:
+            dx += 1.0
             self.facing_direction = (1.0, 0.0)
         
-        # Normalize diagonal movement
-        if self.move_direction[0] != 0.0 and self.move_direction[1] != 0.0:
-            length = (self.move_direction[0]**2 + self.move_direction[1]**2)**0.5
-            self.move_direction = (self.move_direction[0] / length, self.move_direction[1] / length)
+        # Normalize diagonal movement; directions are unit steps, so the
+        # only non-trivial case is a diagonal of length sqrt(2)
+        if dx and dy:
+            dx *= _INV_SQRT2
+            dy *= _INV_SQRT2
+        
+        self.move_direction = (dx, dy)
+        self.is_moving = dx != 0.0 or dy != 0.0
         
         # Check sprint key
-        self.is_sprinting = keys_pressed.get(self.sprint_key, False)
+        self.is_sprinting = bool(keys[self._k_sprint])
         
         # Calculate movement speed
         speed = self.move_speed
         if self.is_sprinting:
             speed *= self.sprint_multiplier
         
-        # Calculate movement vector
-        move_x = self.move_direction[0] * speed * dt
-        move_y = self.move_direction[1] * speed * dt
+        return speed
+    
+    def process_input(self, dt: float, keys: Optional[Sequence[bool]] = None) -> Tuple[float, float]:
+        """
+        Process input and return the movement vector.
         
-        # Update moving state
-        self.is_moving = move_x != 0.0 or move_y != 0.0
+        Args:
+            dt: Delta time in seconds
+            keys: Keyboard state from pygame.key.get_pressed(); fetched if
+                not provided
+            
+        Returns:
+            Tuple containing the x and y movement in pixels
+        """
+        speed = self.poll_input(keys)
         
-        return (move_x, move_y)
+        # Calculate movement vector
+        dx, dy = self.move_direction
+        return (dx * speed * dt, dy * speed * dt)
     
-    def process_interaction(self, keys_pressed: Dict[int, bool], key_just_pressed: Dict[int, bool]) -> bool:
+    def process_interaction(self, keys_pressed: Sequence[bool], key_just_pressed: AbstractSet[int]) -> bool:
         """
         Process interaction input.
         
         Args:
-            keys_pressed: Dictionary of pressed keys
-            key_just_pressed: Dictionary of keys that were just pressed this frame
+            keys_pressed: Keyboard state from pygame.key.get_pressed()
+            key_just_pressed: Watched keys that were just pressed this frame
             
         Returns:
             True if an interaction was triggered, False otherwise
         """
-        if key_just_pressed.get(self.interact_key, False) and self.on_interact:
+        # Nothing to trigger without a callback, so skip the key lookup
+        if self.on_interact is None:
+            return False
+        
+        if self._k_interact in key_just_pressed:
             self.on_interact()
             return True
         return False
     
+    def set_key_bindings(
+        self,
+        move_keys: Optional[Dict[str, int]] = None,
+        sprint_key: Optional[int] = None,
+        interact_key: Optional[int] = None
+    ) -> None:
+        """
+        Change the key bindings.
+        
+        Use this rather than assigning the binding attributes directly, so
+        the cached key codes stay in sync.
+        
+        Args:
+            move_keys: Keyboard keys for movement, keyed by direction
+            sprint_key: Key for sprinting
+            interact_key: Key for interactions
+        """
+        if move_keys is not None:
+            self.move_keys = move_keys
+        if sprint_key is not None:
+            self.sprint_key = sprint_key
+        if interact_key is not None:
+            self.interact_key = interact_key
+        self._cache_key_bindings()
+    
     def set_interaction_callback(self, callback: Callable[[], None]) -> None:
         """
         Set the callback function for interactions.
@@ -5,9 +5,14 @@ This module provides the main Application class that handles the game loop,
 window management, and scene transitions.
 """
 import sys
+import asyncio
+import functools
 import logging
 import pygame
-from pygame.locals import QUIT, KEYDOWN, K_ESCAPE
+from pygame.locals import (
+    QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION,
+    WINDOWEXPOSED, WINDOWRESTORED, K_ESCAPE
+)
 from OpenGL.GL import glViewport
 
 from .config import Config
@@ -16,6 +21,14 @@ from .input_manager import InputManager
 from ..ecs.world import World
 
 
+# Event types the application handles; all others are dropped by SDL
+# before they reach the event queue
+HANDLED_EVENT_TYPES = [
+    QUIT, KEYDOWN, KEYUP, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEMOTION,
+    WINDOWEXPOSED, WINDOWRESTORED
+]
+
+
 class Application:
     """
     Main application class managing the game's execution.
@@ -24,6 +37,9 @@ class Application:
     managing the main game loop, and coordinating systems and scenes.
     """
     
+    # Seconds to idle per frame while the window is minimized or hidden
+    INACTIVE_FRAME_DELAY = 0.05
+    
     def __init__(self, config=None):
         """
         Initialize the application.
@@ -40,10 +56,13 @@ class Application:
         
         self.clock = GameClock(self.config.target_fps)
         self.input_manager = InputManager()
+        self.input_manager.on_mouse_motion_callbacks_changed = self._update_event_filter
         self.world = World()
         
         self.current_scene = None
         self.quit_requested = False
+        self.window_active = True
+        self.redraw_requested = True
         self.logger.info("Application initialized")
         
     def _setup_logger(self):
@@ -51,12 +70,14 @@ class Application:
         logger = logging.getLogger("WhenSocietyFalls")
         logger.setLevel(logging.DEBUG if self.config.debug_mode else logging.INFO)
         
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # Loggers are process-wide; only attach the handler once
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            handler.setFormatter(formatter)
+            logger.addHandler(handler)
         
         return logger
         
@@ -75,6 +96,10 @@ class Application:
         )
         pygame.display.set_caption(self.config.window_title)
         
+        # Only queue the event types we actually handle
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
+        
         # Set up the viewport
         glViewport(0, 0, self.config.window_width, self.config.window_height)
         
@@ -89,17 +114,40 @@ class Application:
             self.current_scene.on_exit()
             
         self.current_scene = scene
+        self.redraw_requested = True
         scene.on_enter(self)
+        self._update_event_filter()
         self.logger.info(f"Scene changed to {scene.__class__.__name__}")
     
+    def _update_event_filter(self):
+        """
+        Block mouse motion events when nothing consumes them.
+        
+        Scenes that do not need motion events can set `wants_mouse_motion`
+        to False; the events stay enabled while motion callbacks are
+        registered with the input manager.
+        """
+        wants_motion = getattr(self.current_scene, 'wants_mouse_motion', True)
+        if wants_motion or self.input_manager.mouse_motion_callbacks:
+            pygame.event.set_allowed(MOUSEMOTION)
+        else:
+            pygame.event.set_blocked(MOUSEMOTION)
+    
     def process_events(self):
         """Process SDL events."""
-        for event in pygame.event.get():
+        # Pump once, then drain the already-filtered queue in one batch
+        pygame.event.pump()
+        events = pygame.event.get(pump=False)
+        
+        for event in events:
             if event.type == QUIT:
                 self.quit_requested = True
             elif event.type == KEYDOWN and event.key == K_ESCAPE:
                 if self.config.escape_quits:
                     self.quit_requested = True
+            elif event.type == WINDOWEXPOSED or event.type == WINDOWRESTORED:
+                # Window contents must be redrawn after being uncovered
+                self.redraw_requested = True
             
             self.input_manager.process_event(event)
             
@@ -119,25 +167,88 @@ class Application:
             self.current_scene.update(dt)
     
     def render(self):
-        """Render the current frame."""
-        if self.current_scene:
-            self.current_scene.render()
+        """
+        Render the current frame.
+        
+        The frame is not shown until present() is called.
+        
+        Scenes may expose a `dirty` attribute; when it is False the previous
+        frame is still current and rendering is skipped.
+        
+        Returns:
+            bool: True if a frame was rendered, False if it was skipped.
+        """
+        scene = self.current_scene
+        if scene:
+            dirty = getattr(scene, 'dirty', None)
+            if dirty is False and not self.redraw_requested:
+                return False
             
+            scene.render()
+            
+            if dirty is not None:
+                scene.dirty = False
+        
+        self.redraw_requested = False
+        return True
+    
+    def present(self):
+        """Show the rendered frame."""
         pygame.display.flip()
     
     def run(self):
-        """Run the main game loop."""
+        """Run the main game loop until the application quits."""
+        asyncio.run(self.run_async())
+    
+    async def run_async(self):
+        """
+        Run the main game loop as a coroutine.
+        
+        Frame pacing awaits on the event loop instead of blocking, so other
+        tasks (asset loading, save I/O) can make progress between frames.
+        """
         self.logger.info("Starting main loop")
         
         while not self.quit_requested:
+            # Yield for most of the frame budget; the clock itself handles
+            # the final sub-millisecond wait
+            remaining = self.clock.get_time_until_next_frame() - GameClock.SLEEP_MARGIN
+            await asyncio.sleep(remaining if remaining > 0.0 else 0.0)
             dt = self.clock.tick()
             
             self.process_events()
             self.update(dt)
-            self.render()
+            
+            # Skip rendering entirely while nothing is visible
+            self.window_active = pygame.display.get_active()
+            if not self.window_active:
+                await asyncio.sleep(self.INACTIVE_FRAME_DELAY)
+                continue
+            
+            await asyncio.sleep(0)
+            
+            # Show the frame as soon as it is drawn; skipped frames keep the
+            # previous one on screen
+            if self.render():
+                self.present()
             
         self.logger.info("Main loop ended")
         self.shutdown()
+    
+    async def run_blocking(self, func, *args, **kwargs):
+        """
+        Run a blocking callable in a worker thread without stalling the loop.
+        
+        Args:
+            func: The blocking callable to run (e.g. an asset loader).
+            *args: Positional arguments for the callable.
+            **kwargs: Keyword arguments for the callable.
+            
+        Returns:
+            The callable's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
         
     def shutdown(self):
         """Clean up and shut down the application."""
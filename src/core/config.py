@@ -5,71 +5,91 @@ This module provides the Config class for managing application settings.
 """
 import json
 import os
+from typing import NamedTuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class Config:
+
+def _loads(data):
+    """Parse JSON settings data, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(settings):
+    """Serialize settings to JSON bytes, using orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2).encode('utf-8')
+
+
+class Config(NamedTuple):
     """
     Configuration class for managing application settings.
     
     This class stores configuration settings for the game and provides
-    methods for loading and saving settings to a file.
+    methods for loading and saving settings to a file. Instances are
+    immutable; use `_replace` to derive a configuration with changed values.
+    
+    The constructor takes setting values, e.g. `Config(target_fps=30)`, not
+    a file path; use `Config.load(config_file)` to read settings from a file.
     """
     
-    def __init__(self, config_file=None):
-        """
-        Initialize the configuration with default values.
-        
-        Args:
-            config_file (str, optional): Path to a configuration file to load.
-                If None, default configuration is used.
-        """
-        # Window settings
-        self.window_title = "When Society Falls"
-        self.window_width = 1280
-        self.window_height = 720
-        self.fullscreen = False
-        
-        # Graphics settings
-        self.vsync = True
-        self.target_fps = 60
-        self.render_distance = 10
-        
-        # Audio settings
-        self.master_volume = 1.0
-        self.music_volume = 0.7
-        self.sfx_volume = 0.8
-        
-        # Game settings
-        self.debug_mode = True
-        self.escape_quits = True
-        
-        # If a config file was provided, load it
-        if config_file and os.path.exists(config_file):
-            self.load(config_file)
+    # Window settings
+    window_title: str = "When Society Falls"
+    window_width: int = 1280
+    window_height: int = 720
+    fullscreen: bool = False
+    
+    # Graphics settings
+    vsync: bool = True
+    target_fps: int = 60
+    render_distance: int = 10
+    
+    # Audio settings
+    master_volume: float = 1.0
+    music_volume: float = 0.7
+    sfx_volume: float = 0.8
+    
+    # Game settings
+    debug_mode: bool = True
+    escape_quits: bool = True
     
-    def load(self, config_file):
+    @classmethod
+    def load(cls, config_file=None):
         """
         Load configuration from a file.
         
+        Settings missing from the file keep their default values, and
+        unknown keys are ignored. A missing file is not an error and gives
+        the default configuration; a file that can't be read or parsed is
+        reported and also gives the default configuration.
+        
         Args:
-            config_file (str): Path to the configuration file.
+            config_file (str, optional): Path to the configuration file.
+                If None, the default configuration is returned.
         
         Returns:
-            bool: True if the configuration was loaded successfully, False otherwise.
+            Config: The loaded configuration, or the default configuration
+                if the file could not be loaded.
         """
+        if not config_file or not os.path.exists(config_file):
+            return cls()
+        
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
-                
-            # Update attributes from the loaded data
-            for key, value in config_data.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-                    
-            return True
+            with open(config_file, 'rb') as f:
+                config_data = _loads(f.read())
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error loading configuration: {e}")
-            return False
+            return cls()
+        
+        return cls(**{
+            key: value for key, value in config_data.items() if key in cls._fields
+        })
     
     def save(self, config_file):
         """
@@ -82,12 +102,9 @@ class Config:
             bool: True if the configuration was saved successfully, False otherwise.
         """
         try:
-            # Create a dictionary from instance attributes
-            config_data = {key: value for key, value in self.__dict__.items()}
+            with open(config_file, 'wb') as f:
+                f.write(_dumps(self._asdict()))
             
-            with open(config_file, 'w') as f:
-                json.dump(config_data, f, indent=4)
-                
             return True
         except IOError as e:
             print(f"Error saving configuration: {e}")
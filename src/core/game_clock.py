@@ -14,6 +14,9 @@ class GameClock:
     controlling the game's frame rate and tracking performance metrics.
     """
     
+    # Seconds before the frame boundary left to tick()'s precise wait
+    SLEEP_MARGIN = 0.002
+    
     def __init__(self, target_fps=60):
         """
         Initialize the game clock.
@@ -24,8 +27,14 @@ class GameClock:
         self.target_fps = target_fps
         self.target_frame_time = 1.0 / target_fps
         
-        self.last_time = time.time()
-        self.current_time = self.last_time
+        # Frame budget used for pacing, so frames are not rounded to whole
+        # milliseconds
+        self.target_frame_ns = 1_000_000_000 // target_fps
+        
+        # Timestamps are integer nanoseconds, which keep full precision over
+        # long sessions unlike float seconds
+        self._last_ns = time.perf_counter_ns()
+        self._current_ns = self._last_ns
         self.delta_time = 0.0
         
         # Performance tracking
@@ -35,28 +44,52 @@ class GameClock:
         self.fps_update_interval = 1.0  # Update FPS calculation every second
         self.time_since_fps_update = 0.0
     
+    @property
+    def last_time(self):
+        """
+        Get the timestamp of the previous frame.
+        
+        Returns:
+            float: Performance counter time in seconds.
+        """
+        return self._last_ns * 1e-9
+    
+    @property
+    def current_time(self):
+        """
+        Get the timestamp of the current frame.
+        
+        Returns:
+            float: Performance counter time in seconds.
+        """
+        return self._current_ns * 1e-9
+    
     def tick(self):
         """
         Update the clock and return the time delta since the last frame.
         
         This method calculates the time elapsed since the last call and
-        sleeps if necessary to maintain the target frame rate.
+        waits if necessary to maintain the target frame rate. The wait
+        sleeps until SLEEP_MARGIN before the frame boundary and then yields
+        with time.sleep(0) until the nanosecond deadline, since sleeps can
+        overshoot.
         
         Returns:
             float: Time delta in seconds since the last frame.
         """
-        # Calculate time since last frame
-        self.current_time = time.time()
-        self.delta_time = self.current_time - self.last_time
-        
-        # Sleep to maintain target frame rate if we're running too fast
-        if self.delta_time < self.target_frame_time:
-            sleep_time = self.target_frame_time - self.delta_time
-            time.sleep(sleep_time)
-            
-            # Recalculate delta time after sleeping
-            self.current_time = time.time()
-            self.delta_time = self.current_time - self.last_time
+        deadline = self._last_ns + self.target_frame_ns
+        remaining = (deadline - time.perf_counter_ns()) * 1e-9 - self.SLEEP_MARGIN
+        if remaining > 0.0:
+            time.sleep(remaining)
+        
+        # Yield the GIL while waiting so executor threads keep running
+        now = time.perf_counter_ns()
+        while now < deadline:
+            time.sleep(0)
+            now = time.perf_counter_ns()
+        
+        self._current_ns = now
+        self.delta_time = (self._current_ns - self._last_ns) * 1e-9
         
         # Update performance metrics
         self.frame_count += 1
@@ -71,10 +104,20 @@ class GameClock:
             self.time_since_fps_update = 0.0
         
         # Update last time for next frame
-        self.last_time = self.current_time
+        self._last_ns = self._current_ns
         
         return self.delta_time
     
+    def get_time_until_next_frame(self):
+        """
+        Get the time remaining before the next frame is due.
+        
+        Returns:
+            float: Seconds until the next frame, or 0.0 if it is already due.
+        """
+        remaining_ns = self.target_frame_ns - (time.perf_counter_ns() - self._last_ns)
+        return remaining_ns * 1e-9 if remaining_ns > 0 else 0.0
+    
     def get_fps(self):
         """
         Get the current frames per second.
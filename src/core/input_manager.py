@@ -9,6 +9,35 @@ from pygame.locals import (
 )
 
 
+# Pygame 2 keycodes are either character code points or SDL scancodes tagged
+# with SDLK_SCANCODE_MASK (e.g. K_LSHIFT == 0x400000E1). Scancode keys map to
+# slots 0-511 and character keys follow, which keeps key tables small.
+_SCANCODE_MASK = 1 << 30
+_NUM_SCANCODES = 512
+
+# Initial size of the key callback table: all scancode keys plus the
+# character keys below 512; the table grows for rarer keys
+_KEY_TABLE_SIZE = 2 * _NUM_SCANCODES
+
+# Keyboard snapshot with no keys pressed, used before the first update
+NO_KEYS = pygame.key.ScancodeWrapper(bytes(_NUM_SCANCODES))
+
+
+def _key_slot(key):
+    """
+    Map a pygame keycode to its slot in the key callback table.
+    
+    Args:
+        key: The key code to map.
+        
+    Returns:
+        int: The slot index for the key.
+    """
+    if key & _SCANCODE_MASK:
+        return key ^ _SCANCODE_MASK
+    return key + _NUM_SCANCODES
+
+
 class InputManager:
     """
     Input manager for handling user input.
@@ -19,10 +48,9 @@ class InputManager:
     
     def __init__(self):
         """Initialize the input manager."""
-        # Keyboard state tracking
-        self.keys_pressed = set()
-        self.keys_down = set()
-        self.keys_up = set()
+        # Keyboard state snapshots for this and the previous frame
+        self.keys_pressed = NO_KEYS
+        self.previous_keys_pressed = NO_KEYS
         
         # Mouse state tracking
         self.mouse_position = (0, 0)
@@ -32,9 +60,13 @@ class InputManager:
         self.mouse_wheel_y = 0
         
         # Callback registrations
-        self.key_callbacks = {}
+        self.key_callbacks = [None] * _KEY_TABLE_SIZE
         self.mouse_button_callbacks = {}
         self.mouse_motion_callbacks = []
+        
+        # Called with no arguments when motion callbacks are registered, so
+        # the owner of the SDL event filter can re-enable motion events
+        self.on_mouse_motion_callbacks_changed = None
     
     def process_event(self, event):
         """
@@ -43,24 +75,23 @@ class InputManager:
         Args:
             event: Pygame event to process.
         """
-        # Keyboard events
+        # Keyboard events; key state itself comes from the per-frame snapshot
         if event.type == KEYDOWN:
-            self.keys_pressed.add(event.key)
-            self.keys_down.add(event.key)
+            index = _key_slot(event.key)
             
             # Call registered callbacks for this key
-            if event.key in self.key_callbacks:
-                for callback in self.key_callbacks[event.key]:
+            callbacks = self.key_callbacks[index] if index < len(self.key_callbacks) else None
+            if callbacks:
+                for callback in callbacks:
                     callback(event.key, True)
                     
         elif event.type == KEYUP:
-            if event.key in self.keys_pressed:
-                self.keys_pressed.remove(event.key)
-            self.keys_up.add(event.key)
+            index = _key_slot(event.key)
             
             # Call registered callbacks for this key
-            if event.key in self.key_callbacks:
-                for callback in self.key_callbacks[event.key]:
+            callbacks = self.key_callbacks[index] if index < len(self.key_callbacks) else None
+            if callbacks:
+                for callback in callbacks:
                     callback(event.key, False)
         
         # Mouse events
@@ -91,10 +122,21 @@ class InputManager:
                     callback(event.button, False, event.pos)
     
     def update(self):
-        """Update input state at the end of the frame."""
+        """
+        Update input state for the new frame.
+        
+        Call once per frame after events have been processed.
+        """
+        # Snapshot the whole keyboard in one call; per-key pressed and
+        # released edges are derived from the two snapshots on demand
+        self.previous_keys_pressed = self.keys_pressed
+        self.keys_pressed = pygame.key.get_pressed()
+        
+        # Poll the cursor so its position stays current even while mouse
+        # motion events are blocked
+        self.mouse_position = pygame.mouse.get_pos()
+        
         # Clear one-frame states
-        self.keys_down.clear()
-        self.keys_up.clear()
         self.mouse_buttons_down.clear()
         self.mouse_buttons_up.clear()
         self.mouse_wheel_y = 0
@@ -109,7 +151,7 @@ class InputManager:
         Returns:
             bool: True if the key is currently pressed, False otherwise.
         """
-        return key in self.keys_pressed
+        return bool(self.keys_pressed[key])
     
     def is_key_down(self, key):
         """
@@ -121,7 +163,7 @@ class InputManager:
         Returns:
             bool: True if the key was pressed this frame, False otherwise.
         """
-        return key in self.keys_down
+        return bool(self.keys_pressed[key] and not self.previous_keys_pressed[key])
     
     def is_key_up(self, key):
         """
@@ -133,7 +175,7 @@ class InputManager:
         Returns:
             bool: True if the key was released this frame, False otherwise.
         """
-        return key in self.keys_up
+        return bool(self.previous_keys_pressed[key] and not self.keys_pressed[key])
     
     def is_mouse_button_pressed(self, button):
         """
@@ -190,9 +232,14 @@ class InputManager:
                 The callback should accept two arguments: the key code and
                 a boolean indicating whether the key is pressed.
         """
-        if key not in self.key_callbacks:
-            self.key_callbacks[key] = []
-        self.key_callbacks[key].append(callback)
+        index = _key_slot(key)
+        if index >= len(self.key_callbacks):
+            self.key_callbacks.extend([None] * (index + 1 - len(self.key_callbacks)))
+        
+        callbacks = self.key_callbacks[index]
+        if callbacks is None:
+            callbacks = self.key_callbacks[index] = []
+        callbacks.append(callback)
     
     def register_mouse_button_callback(self, button, callback):
         """
@@ -218,4 +265,7 @@ class InputManager:
                 The callback should accept two arguments: the mouse position
                 and the relative movement.
         """
-        self.mouse_motion_callbacks.append(callback)
\ No newline at end of file
+        self.mouse_motion_callbacks.append(callback)
+        
+        if self.on_mouse_motion_callbacks_changed is not None:
+            self.on_mouse_motion_callbacks_changed()
\ No newline at end of file
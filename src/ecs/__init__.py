@@ -4,14 +4,19 @@ Entity Component System (ECS) package.
 This package provides the implementation of an Entity Component System.
 """
 
-from src.ecs.entity import Entity
-from src.ecs.component import Component
+from src.ecs.entity import Entity, EntityIdAllocator
+from src.ecs.component import Component, component_mask
 from src.ecs.system import System
 from src.ecs.world import World
+from src.ecs.storage import SoAStore, SparseSet
 
 __all__ = [
     'Entity',
+    'EntityIdAllocator',
     'Component',
+    'component_mask',
     'System',
     'World',
+    'SoAStore',
+    'SparseSet',
 ]
\ No newline at end of file
@@ -5,6 +5,26 @@ This module provides the base Component class used in the ECS architecture.
 """
 
 
+# Bitmask assigned to each component type, in order of first use
+_component_masks = {}
+
+
+def component_mask(component_types):
+    """
+    Build the combined bitmask for a collection of component types.
+    
+    Args:
+        component_types: The component types to include.
+        
+    Returns:
+        int: The bitwise OR of the component types' masks.
+    """
+    mask = 0
+    for component_type in component_types:
+        mask |= component_type.get_component_mask()
+    return mask
+
+
 class Component:
     """
     Base class for all components in the ECS.
@@ -66,4 +86,21 @@ class Component:
         Returns:
             The component class.
         """
-        return cls
\ No newline at end of file
+        return cls
+        
+    @classmethod
+    def get_component_mask(cls):
+        """
+        Get the bitmask identifying this component type.
+        
+        Each component type is assigned its own bit the first time it is
+        requested. Python ints are unbounded, so the number of component
+        types is not limited.
+        
+        Returns:
+            int: The bitmask for this component type.
+        """
+        mask = _component_masks.get(cls)
+        if mask is None:
+            mask = _component_masks[cls] = 1 << len(_component_masks)
+        return mask
\ No newline at end of file
@@ -3,7 +3,112 @@ Entity module for Entity Component System.
 
 This module provides the Entity class used in the ECS architecture.
 """
-import uuid
+from src.ecs.component import component_mask
+
+
+# Entity IDs pack a slot index into the low bits and a generation counter
+# into the bits above it, so slots of destroyed entities can be reused while
+# IDs held by stale references stay distinguishable
+ENTITY_INDEX_BITS = 20
+ENTITY_INDEX_MASK = (1 << ENTITY_INDEX_BITS) - 1
+ENTITY_GENERATION_MASK = (1 << 12) - 1
+
+# Bit assigned to each tag, in order of first use
+_tag_bits = {}
+
+# Tags by bit position, for turning a tag mask back into tag names
+_tag_names = []
+
+
+def _tag_bit(tag):
+    """
+    Get the bit identifying a tag, assigning one on first use.
+    
+    Args:
+        tag: The tag to look up.
+        
+    Returns:
+        int: The tag's bit.
+    """
+    bit = _tag_bits.get(tag)
+    if bit is None:
+        bit = 1 << len(_tag_names)
+        _tag_bits[tag] = bit
+        _tag_names.append(tag)
+    return bit
+
+
+class EntityIdAllocator:
+    """
+    Allocator for integer entity IDs.
+    
+    IDs are packed as `(generation << ENTITY_INDEX_BITS) | index`. Released
+    indices are reused with an incremented generation, so a recycled ID
+    never equals the ID it replaced.
+    """
+    
+    def __init__(self):
+        """Initialize the allocator."""
+        self._generations = []
+        self._free_indices = []
+        
+    def allocate(self):
+        """
+        Allocate a new entity ID.
+        
+        Returns:
+            int: The allocated ID.
+            
+        Raises:
+            RuntimeError: If every index is in use.
+        """
+        if self._free_indices:
+            index = self._free_indices.pop()
+        else:
+            index = len(self._generations)
+            if index > ENTITY_INDEX_MASK:
+                raise RuntimeError("Entity ID space exhausted")
+            self._generations.append(0)
+            
+        return (self._generations[index] << ENTITY_INDEX_BITS) | index
+        
+    def release(self, entity_id):
+        """
+        Release an entity ID so its index can be reused.
+        
+        Args:
+            entity_id: The ID to release.
+            
+        Returns:
+            bool: True if the ID was released, False if it was not a live
+                ID from this allocator.
+        """
+        if not self.is_alive(entity_id):
+            return False
+            
+        index = entity_id & ENTITY_INDEX_MASK
+        self._generations[index] = (self._generations[index] + 1) & ENTITY_GENERATION_MASK
+        self._free_indices.append(index)
+        return True
+        
+    def is_alive(self, entity_id):
+        """
+        Check if an ID refers to a live allocation.
+        
+        Args:
+            entity_id: The ID to check.
+            
+        Returns:
+            bool: True if the ID is live, False if it was released or was
+                not allocated by this allocator.
+        """
+        if not isinstance(entity_id, int):
+            return False
+            
+        index = entity_id & ENTITY_INDEX_MASK
+        generations = self._generations
+        return (index < len(generations)
+                and generations[index] == entity_id >> ENTITY_INDEX_BITS)
 
 
 class Entity:
@@ -14,21 +119,38 @@ class Entity:
     and methods for adding, removing, and retrieving components.
     """
     
+    __slots__ = ('id', 'world', 'components', 'tags', 'active', 'mask', '_owns_id', '__weakref__')
+    
+    # Shared allocator for entity IDs
+    id_allocator = EntityIdAllocator()
+    
+    # Incremented whenever any entity gains or loses a component or changes
+    # active state, so systems can tell when cached entity views are stale
+    structure_version = 0
+    
     def __init__(self, world, entity_id=None):
         """
         Initialize a new entity.
         
         Args:
             world: The World instance this entity belongs to.
-            entity_id (optional): A unique ID for this entity.
-                If None, a new UUID is generated.
+            entity_id (optional): A unique ID for this entity, used as given.
+                If None, a new integer ID is allocated.
         """
-        self.id = entity_id or str(uuid.uuid4())
+        # Only IDs taken from the allocator are released on destroy, so an
+        # explicit ID can't free a slot that another entity still holds
+        self._owns_id = entity_id is None
+        self.id = Entity.id_allocator.allocate() if self._owns_id else entity_id
         self.world = world
         self.components = {}
-        self.tags = set()
         self.active = True
         
+        # Bitmask of the entity's tags; use get_tags for the tag names
+        self.tags = 0
+        
+        # Bitmask of the attached component types
+        self.mask = 0
+        
     def add_component(self, component):
         """
         Add a component to this entity.
@@ -50,6 +172,8 @@ class Entity:
         
         # Add the component
         self.components[component_type] = component
+        self.mask |= component_type.get_component_mask()
+        Entity.structure_version += 1
         
         # Notify the world of the new component
         self.world._entity_component_added(self, component)
@@ -77,6 +201,8 @@ class Entity:
             
             # Remove the component
             del self.components[component_type]
+            self.mask &= ~component_type.get_component_mask()
+            Entity.structure_version += 1
             
             # Notify the world of the removed component
             self.world._entity_component_removed(self, component)
@@ -97,6 +223,20 @@ class Entity:
         """
         return self.components.get(component_type)
         
+    def get_components(self, *component_types):
+        """
+        Get several components at once.
+        
+        Args:
+            *component_types: The types of component to get.
+            
+        Returns:
+            tuple: The components in the order of `component_types`, with
+                None for each type this entity doesn't have.
+        """
+        components = self.components
+        return tuple(components.get(component_type) for component_type in component_types)
+        
     def has_component(self, component_type):
         """
         Check if this entity has a component of the specified type.
@@ -121,7 +261,24 @@ class Entity:
             bool: True if the entity has all of the specified component types,
                 False otherwise.
         """
-        return all(ct in self.components for ct in component_types)
+        required_mask = component_mask(component_types)
+        return self.mask & required_mask == required_mask
+        
+    def has_component_mask(self, required_mask):
+        """
+        Check if this entity has all component types in a precomputed mask.
+        
+        Systems with a fixed set of required components can build the mask
+        once with `component_mask` and check entities with a single AND.
+        
+        Args:
+            required_mask: Bitmask of the required component types.
+            
+        Returns:
+            bool: True if the entity has all of the component types in the
+                mask, False otherwise.
+        """
+        return self.mask & required_mask == required_mask
         
     def add_tag(self, tag):
         """
@@ -133,7 +290,7 @@ class Entity:
         Returns:
             self: For method chaining.
         """
-        self.tags.add(tag)
+        self.tags |= _tag_bit(tag)
         self.world._entity_tag_added(self, tag)
         return self
         
@@ -147,8 +304,9 @@ class Entity:
         Returns:
             bool: True if the tag was removed, False if it wasn't present.
         """
-        if tag in self.tags:
-            self.tags.remove(tag)
+        bit = _tag_bits.get(tag, 0)
+        if self.tags & bit:
+            self.tags &= ~bit
             self.world._entity_tag_removed(self, tag)
             return True
         return False
@@ -163,7 +321,17 @@ class Entity:
         Returns:
             bool: True if the entity has the tag, False otherwise.
         """
-        return tag in self.tags
+        return (self.tags & _tag_bits.get(tag, 0)) != 0
+        
+    def get_tags(self):
+        """
+        Get the tags of this entity.
+        
+        Returns:
+            set: The entity's tags.
+        """
+        tags = self.tags
+        return {tag for index, tag in enumerate(_tag_names) if tags >> index & 1}
         
     def destroy(self):
         """
@@ -172,13 +340,29 @@ class Entity:
         This method removes all components and then asks the world
         to remove this entity.
         """
-        # Remove all components
-        for component_type in list(self.components.keys()):
-            self.remove_component(component_type)
+        components = self.components
+        if components:
+            # Notify the components that they're being removed
+            removed = list(components.values())
+            for component in removed:
+                component.on_remove()
+                
+            # Remove all components at once
+            components.clear()
+            self.mask = 0
+            Entity.structure_version += 1
+            
+            # Notify the world of the removed components
+            for component in removed:
+                self.world._entity_component_removed(self, component)
             
         # Tell the world to remove this entity
         self.world._remove_entity(self)
         
+        # Recycle the ID if it came from the allocator
+        if self._owns_id:
+            Entity.id_allocator.release(self.id)
+        
     def is_active(self):
         """
         Check if this entity is active.
@@ -202,5 +386,6 @@ class Entity:
         """
         if self.active != active:
             self.active = active
+            Entity.structure_version += 1
             self.world._entity_active_changed(self, active)
         return self
\ No newline at end of file
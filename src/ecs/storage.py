@@ -0,0 +1,254 @@
+"""
+Storage module for Entity Component System.
+
+This module provides contiguous array storage for component data.
+"""
+import numpy as np
+
+
+class SoAStore:
+    """
+    Struct-of-arrays storage for component data.
+    
+    Each field is kept in its own contiguous NumPy array, so systems can
+    process one field for every row with a single vectorized operation.
+    Rows are densely packed; removing a row moves the last row into its
+    place. Fields are accessed as attributes, e.g. `store.x`, which returns
+    a view over the rows in use.
+    """
+    
+    def __init__(self, fields, capacity=16):
+        """
+        Initialize the store.
+        
+        Args:
+            fields: Sequence of (name, dtype) pairs describing each field,
+                e.g. [('x', 'f4'), ('y', 'f4')].
+            capacity (int, optional): Number of rows to preallocate.
+        """
+        self.fields = tuple(fields)
+        self._columns = {
+            name: np.zeros(capacity, dtype=dtype) for name, dtype in self.fields
+        }
+        self._count = 0
+        self._capacity = capacity
+    
+    def __len__(self):
+        """Return the number of rows in use."""
+        return self._count
+    
+    def __getattr__(self, name):
+        """Return a view of the named field over the rows in use."""
+        try:
+            column = self.__dict__['_columns'][name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column[:self._count]
+    
+    def column(self, name):
+        """
+        Get a view of a field over the rows in use.
+        
+        Args:
+            name: The field name.
+        
+        Returns:
+            numpy.ndarray: A view of the field's values.
+        """
+        return self._columns[name][:self._count]
+    
+    def resize(self, count):
+        """
+        Set the number of rows in use, growing the arrays if needed.
+        
+        Existing rows keep their values; newly exposed rows are not cleared
+        and must be written before use.
+        
+        Args:
+            count: The new number of rows.
+        """
+        if count > self._capacity:
+            self._grow(max(count, 2 * self._capacity))
+        self._count = count
+    
+    def append(self, **values):
+        """
+        Append a row to the store.
+        
+        Args:
+            **values: Initial values by field name; omitted fields are zero.
+        
+        Returns:
+            int: The index of the new row.
+        """
+        row = self._count
+        self.resize(row + 1)
+        
+        columns = self._columns
+        for name in columns:
+            columns[name][row] = values.get(name, 0)
+        
+        return row
+    
+    def swap_remove(self, row):
+        """
+        Remove a row by moving the last row into its place.
+        
+        Args:
+            row: The index of the row to remove.
+        
+        Returns:
+            int: The previous index of the row that was moved into `row`,
+                or -1 if the removed row was the last one.
+        """
+        last = self._count - 1
+        if row != last:
+            for column in self._columns.values():
+                column[row] = column[last]
+        self._count = last
+        return last if row != last else -1
+    
+    def _grow(self, capacity):
+        """
+        Reallocate every field with a larger capacity.
+        
+        Args:
+            capacity: The new number of rows to allocate.
+        """
+        for name, column in self._columns.items():
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[:self._count] = column[:self._count]
+            self._columns[name] = grown
+        self._capacity = capacity
+
+
+class SparseSet:
+    """
+    Sparse set mapping entity IDs to densely packed values.
+    
+    Values are kept in the `dense` list with their entity IDs at the same
+    positions in `entities`, so iteration walks contiguous lists. `sparse`
+    maps an entity ID to its dense index, or -1 if the entity is absent.
+    Keys must be small non-negative integers; for generation-tagged entity
+    IDs use the slot index (`entity_id & ENTITY_INDEX_MASK`).
+    
+    Removal moves the last entry into the freed slot, matching
+    SoAStore.swap_remove, so dense indices can also address SoAStore rows.
+    """
+    
+    def __init__(self):
+        """Initialize an empty sparse set."""
+        self.sparse = []
+        self.dense = []
+        self.entities = []
+    
+    def __len__(self):
+        """Return the number of entries."""
+        return len(self.dense)
+    
+    def __contains__(self, entity_id):
+        """Check whether the entity has an entry."""
+        return self.has(entity_id)
+    
+    def __iter__(self):
+        """Iterate over (entity ID, value) pairs in dense order."""
+        return zip(self.entities, self.dense)
+    
+    def has(self, entity_id):
+        """
+        Check whether the entity has an entry.
+        
+        Args:
+            entity_id: The entity ID to check.
+        
+        Returns:
+            bool: True if the entity has an entry, False otherwise.
+        """
+        sparse = self.sparse
+        return entity_id < len(sparse) and sparse[entity_id] != -1
+    
+    def index(self, entity_id):
+        """
+        Get the dense index of an entity's entry.
+        
+        Args:
+            entity_id: The entity ID to look up.
+        
+        Returns:
+            int: The dense index, or -1 if the entity has no entry.
+        """
+        sparse = self.sparse
+        return sparse[entity_id] if entity_id < len(sparse) else -1
+    
+    def get(self, entity_id, default=None):
+        """
+        Get the value stored for an entity.
+        
+        Args:
+            entity_id: The entity ID to look up.
+            default (optional): Value returned if the entity has no entry.
+        
+        Returns:
+            The stored value, or `default` if the entity has no entry.
+        """
+        sparse = self.sparse
+        if entity_id < len(sparse):
+            index = sparse[entity_id]
+            if index != -1:
+                return self.dense[index]
+        return default
+    
+    def add(self, entity_id, value):
+        """
+        Add an entry for an entity.
+        
+        Args:
+            entity_id: The entity ID to add.
+            value: The value to store.
+        
+        Returns:
+            int: The dense index of the new entry.
+        
+        Raises:
+            ValueError: If the entity already has an entry.
+        """
+        sparse = self.sparse
+        if entity_id >= len(sparse):
+            sparse.extend([-1] * (entity_id + 1 - len(sparse)))
+        elif sparse[entity_id] != -1:
+            raise ValueError(f"Entity {entity_id} already has an entry")
+        
+        index = len(self.dense)
+        sparse[entity_id] = index
+        self.dense.append(value)
+        self.entities.append(entity_id)
+        return index
+    
+    def remove(self, entity_id):
+        """
+        Remove an entity's entry.
+        
+        Args:
+            entity_id: The entity ID to remove.
+        
+        Returns:
+            The removed value, or None if the entity had no entry.
+        """
+        index = self.index(entity_id)
+        if index == -1:
+            return None
+        
+        dense = self.dense
+        entities = self.entities
+        value = dense[index]
+        
+        # Move the last entry into the freed slot
+        last_entity = entities[-1]
+        dense[index] = dense[-1]
+        entities[index] = last_entity
+        self.sparse[last_entity] = index
+        
+        dense.pop()
+        entities.pop()
+        self.sparse[entity_id] = -1
+        return value
@@ -7,12 +7,15 @@ import logging
 from typing import Set, Type, List, Dict, Tuple, Optional
 import pygame
 
+from src.core.input_manager import NO_KEYS
 from src.ecs.system import System
 from src.ecs.component import Component
 from src.ecs.entity import Entity
+from src.ecs.storage import SoAStore
 from src.components.transform import Transform
-from src.components.player_controller import PlayerController
+from src.components.player_controller import PlayerController, CONTROLLER_FIELDS
 from src.components.physics import RigidBody, Collider
+from src.components._kernels import process_controllers
 
 
 class PlayerSystem(System):
@@ -29,12 +32,19 @@ class PlayerSystem(System):
         self.logger = logging.getLogger('PlayerSystem')
         
         # Input state
-        self.keys_pressed = {}
-        self.keys_just_pressed = {}
-        self.previous_keys = {}
+        self.keys_pressed = NO_KEYS
+        self.keys_just_pressed = set()
+        self.previous_keys = NO_KEYS
         
         # Player entities (should typically be just one)
         self.player_entities = []
+        
+        # Per-controller struct-of-arrays buffers for batch movement
+        self.controller_buffers = SoAStore(CONTROLLER_FIELDS, capacity=4)
+        
+        # Cached component rows, rebuilt when entity membership changes
+        self._view = []
+        self._view_key = None
     
     def initialize(self, world):
         """
@@ -57,63 +67,118 @@ class PlayerSystem(System):
         # Update the player entities list
         self.player_entities = entities
         
+        view = self._get_view(entities)
+        
         # Update input state
-        self._update_input_state()
+        self._update_input_state(view)
+        
+        buffers = self.controller_buffers
+        buffers.resize(len(view))
+        
+        # Gather controller state into the SoA buffers
+        dx, dy, speed = buffers.dx, buffers.dy, buffers.speed
+        for i, (player_controller, _, _, _) in enumerate(view):
+            speed[i] = player_controller.poll_input(self.keys_pressed)
+            dx[i], dy[i] = player_controller.move_direction
+        
+        # Compute movement for all controllers at once
+        move_x, move_y = buffers.move_x, buffers.move_y
+        process_controllers(dx, dy, speed, dt, move_x, move_y)
         
-        # Process player input and movement
-        for entity in entities:
-            self._process_entity(dt, entity)
+        # Apply movement and process interactions
+        inv_dt = 1.0 / dt if dt > 0.0 else 0.0
+        for i, (player_controller, transform, rigid_body, _) in enumerate(view):
+            self._process_entity(inv_dt, player_controller, transform, rigid_body,
+                                 (float(move_x[i]), float(move_y[i])))
+    
+    def _get_view(self, entities: List[Entity]) -> List[Tuple]:
+        """
+        Get the component rows for the player entities.
+        
+        Each row holds the PlayerController, Transform, RigidBody and
+        Collider of one entity, with None for missing optional components.
+        Rows are cached and only rebuilt when component membership changes.
+        
+        Args:
+            entities: List of entities with required components
+            
+        Returns:
+            List of component tuples, one per entity
+        """
+        view_key = (Entity.structure_version, len(entities))
+        if view_key != self._view_key:
+            self._view = [
+                entity.get_components(PlayerController, Transform, RigidBody, Collider)
+                for entity in entities
+            ]
+            self._view_key = view_key
+        return self._view
     
-    def _update_input_state(self) -> None:
-        """Update the input state for this frame."""
-        # Store previous keys
-        self.previous_keys = self.keys_pressed.copy()
-        
-        # Get current keys
-        key_state = pygame.key.get_pressed()
-        self.keys_pressed = {key: key_state[key] for key in range(len(key_state)) if key_state[key]}
-        
-        # Determine keys that were just pressed this frame
-        self.keys_just_pressed = {
-            key: True for key in self.keys_pressed if key not in self.previous_keys
-        }
+    def _update_input_state(self, view: List[Tuple]) -> None:
+        """
+        Update the input state for this frame.
+        
+        Args:
+            view: Component rows of the player entities
+        """
+        # Keep last frame's snapshot by reference; get_pressed returns a
+        # new snapshot each call
+        self.previous_keys = self.keys_pressed
+        self.keys_pressed = pygame.key.get_pressed()
+        
+        # Only keys watched by a controller need just-pressed tracking; the
+        # set is reused between frames instead of being rebuilt
+        current = self.keys_pressed
+        previous = self.previous_keys
+        keys_just_pressed = self.keys_just_pressed
+        keys_just_pressed.clear()
+        for player_controller, _, _, _ in view:
+            for key in player_controller.watched_keys:
+                if current[key] and not previous[key]:
+                    keys_just_pressed.add(key)
     
-    def _process_entity(self, dt: float, entity: Entity) -> None:
+    def _process_entity(
+        self,
+        inv_dt: float,
+        player_controller: PlayerController,
+        transform: Transform,
+        rigid_body: Optional[RigidBody],
+        movement: Tuple[float, float]
+    ) -> None:
         """
-        Process input and movement for a player entity.
+        Apply movement and process interactions for a player entity.
         
         Args:
-            dt: Delta time in seconds
-            entity: Player entity to process
+            inv_dt: Reciprocal of the delta time in seconds
+            player_controller: The entity's player controller
+            transform: The entity's transform
+            rigid_body: The entity's rigid body, if it has one
+            movement: The x and y movement in pixels for this frame
         """
-        # Get components
-        player_controller = entity.get_component(PlayerController)
-        transform = entity.get_component(Transform)
-        
-        # Optional physics components
-        rigid_body = entity.get_component(RigidBody)
-        collider = entity.get_component(Collider)
-        
-        # Process input for movement
-        movement = player_controller.process_input(dt, self.keys_pressed)
-        
-        # Apply movement to transform
-        if rigid_body and rigid_body.is_kinematic:
-            # For kinematic rigidbodies, we set the velocity
-            rigid_body.velocity = (movement[0] / dt, movement[1] / dt)
-        else:
-            # Direct transform modification for non-physics entities
-            transform.position = (
-                transform.position[0] + movement[0],
-                transform.position[1] + movement[1]
-            )
+        kinematic = rigid_body is not None and rigid_body.is_kinematic
+        
+        if movement[0] != 0.0 or movement[1] != 0.0:
+            # Apply movement to transform
+            if kinematic:
+                # For kinematic rigidbodies, we set the velocity
+                rigid_body.velocity = (movement[0] * inv_dt, movement[1] * inv_dt)
+            else:
+                # Direct transform modification for non-physics entities
+                transform.position = (
+                    transform.position[0] + movement[0],
+                    transform.position[1] + movement[1]
+                )
+            
+            # Log movement for debugging
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Player moved: {movement}, pos: {transform.position}")
+        elif kinematic and rigid_body.velocity != (0.0, 0.0):
+            # Idle players leave the transform alone; a kinematic body only
+            # needs its velocity cleared once when it stops
+            rigid_body.velocity = (0.0, 0.0)
         
         # Process interactions
         player_controller.process_interaction(self.keys_pressed, self.keys_just_pressed)
-        
-        # Log movement for debugging
-        if movement[0] != 0 or movement[1] != 0:
-            self.logger.debug(f"Player moved: {movement}, pos: {transform.position}")
     
     def get_player_entity(self) -> Optional[Entity]:
         """
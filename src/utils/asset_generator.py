@@ -3,12 +3,112 @@ Asset generator for creating placeholder graphics.
 
 This module provides functions for procedurally generating placeholder 
 assets with a consistent cel-shaded style.
+
+The create_* functions cache their surfaces by argument and share them
+between callers, so they must not be modified; copy a surface before
+drawing on it. generate_library_assets already returns copies.
 """
+import functools
 import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pygame
 from typing import Tuple, List, Dict, Optional
 
 
+# Library scene assets by name, copied by generate_library_assets
+_PROTOTYPE_CACHE: Dict[str, pygame.Surface] = {}
+
+
+def _hashable(value):
+    """
+    Convert a sequence argument to a tuple so it can be used as a cache key.
+    
+    Args:
+        value: The argument to convert
+        
+    Returns:
+        A tuple for lists, NumPy arrays, pygame Colors and other non-string
+        sequences; any other value unchanged
+    """
+    if isinstance(value, (str, bytes, tuple)):
+        return value
+    if isinstance(value, np.ndarray):
+        return tuple(value.tolist())
+    if isinstance(value, (pygame.Color, Sequence)):
+        return tuple(value)
+    return value
+
+
+def _cached_asset(factory):
+    """
+    Cache an asset factory's surfaces by argument.
+    
+    Sequence arguments such as colors given as lists, NumPy arrays or
+    pygame Colors are converted to tuples before the cache lookup so they
+    can be hashed.
+    
+    Args:
+        factory: The asset factory to cache
+        
+    Returns:
+        The cached factory, with the `cache_clear` and `cache_info` methods
+        of functools.lru_cache
+    """
+    cached = functools.lru_cache(maxsize=128)(factory)
+    
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        args = tuple(_hashable(arg) for arg in args)
+        kwargs = {name: _hashable(value) for name, value in kwargs.items()}
+        return cached(*args, **kwargs)
+    
+    wrapper.cache_clear = cached.cache_clear
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Copy a surface in the display's pixel format for fast blits.
+    
+    Surfaces with an alpha channel keep it. When no display mode has been
+    set, a plain copy is returned.
+    
+    Args:
+        surface: The surface to copy
+        
+    Returns:
+        The new surface
+    """
+    if pygame.display.get_surface() is None:
+        return surface.copy()
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+@functools.lru_cache(maxsize=256)
+def _shade(color: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
+    """
+    Scale a color by a brightness factor.
+    
+    Args:
+        color: Color to shade (RGB)
+        factor: Multiplier for each channel
+        
+    Returns:
+        The shaded color as integers, clamped to 255
+    """
+    return (
+        min(255, int(color[0] * factor)),
+        min(255, int(color[1] * factor)),
+        min(255, int(color[2] * factor))
+    )
+
+
+@_cached_asset
 def create_bookshelf(
     width: int = 64, 
     height: int = 96, 
@@ -31,16 +131,16 @@ def create_bookshelf(
     
     # Main shelf structure
     shelf_rect = pygame.Rect(0, 0, width, height)
-    pygame.draw.rect(surface, color, shelf_rect)
+    surface.fill(color, shelf_rect)
     
     # Darker edge for depth
-    dark_color = (color[0] * 0.7, color[1] * 0.7, color[2] * 0.7)
+    dark_color = _shade(color, 0.7)
     edge_width = max(2, width // 10)
     edge_rect = pygame.Rect(width - edge_width, 0, edge_width, height)
-    pygame.draw.rect(surface, dark_color, edge_rect)
+    surface.fill(dark_color, edge_rect)
     
     # Shelf dividers - horizontal lines
-    divider_color = (color[0] * 0.8, color[1] * 0.8, color[2] * 0.8)
+    divider_color = _shade(color, 0.8)
     num_shelves = 4
     shelf_spacing = height // (num_shelves + 1)
     
@@ -57,35 +157,40 @@ def create_bookshelf(
         (243, 156, 18)    # Yellow
     ]
     
+    book_height = shelf_spacing - 4
+    book_width = width // 8
+    book_spacing = book_width + 2
+    
+    # Every shelf uses the same book layout, so work out each book's
+    # position and colors once
+    books = []
+    for book in range(5):
+        if book % 4 == 0:  # Skip some spots to create variation
+            continue
+        
+        book_color = book_colors[book % len(book_colors)]
+        book_x = book * book_spacing
+        
+        if book_x + book_width > width - edge_width:
+            break
+        
+        spine_color = _shade(book_color, 0.8)
+        books.append((book_x, book_color, spine_color))
+    
     # Place books on each shelf
     for shelf in range(num_shelves + 1):
         shelf_y = shelf * shelf_spacing
         if shelf == 0:
             shelf_y = 2  # Adjust top shelf position
-            
-        book_height = shelf_spacing - 4
-        book_width = width // 8
-        book_spacing = book_width + 2
         
-        # Place 3-5 books on each shelf, randomly colored
-        for book in range(5):
-            if book % 4 == 0:  # Skip some spots to create variation
-                continue
-                
-            book_color = book_colors[book % len(book_colors)]
-            book_x = book * book_spacing
-            
-            if book_x + book_width > width - edge_width:
-                break
-                
-            book_rect = pygame.Rect(book_x, shelf_y + 2, book_width, book_height)
-            pygame.draw.rect(surface, book_color, book_rect)
+        for book_x, book_color, spine_color in books:
+            surface.fill(book_color, (book_x, shelf_y + 2, book_width, book_height))
             
             # Add book spine detail
-            spine_color = (book_color[0] * 0.8, book_color[1] * 0.8, book_color[2] * 0.8)
+            spine_x = book_x + book_width // 2
             pygame.draw.line(surface, spine_color, 
-                            (book_x + book_width // 2, shelf_y + 2), 
-                            (book_x + book_width // 2, shelf_y + book_height), 1)
+                            (spine_x, shelf_y + 2), 
+                            (spine_x, shelf_y + book_height), 1)
     
     # Add outline
     pygame.draw.rect(surface, (0, 0, 0), shelf_rect, 2)
@@ -93,6 +198,7 @@ def create_bookshelf(
     return surface
 
 
+@_cached_asset
 def create_desk(
     width: int = 96, 
     height: int = 64, 
@@ -116,27 +222,27 @@ def create_desk(
     # Main desk surface
     desk_top_height = height // 3
     desk_top_rect = pygame.Rect(0, 0, width, desk_top_height)
-    pygame.draw.rect(surface, color, desk_top_rect)
+    surface.fill(color, desk_top_rect)
     
     # Desk front panel
-    front_color = (color[0] * 0.8, color[1] * 0.8, color[2] * 0.8)
+    front_color = _shade(color, 0.8)
     front_rect = pygame.Rect(0, desk_top_height, width, height - desk_top_height)
-    pygame.draw.rect(surface, front_color, front_rect)
+    surface.fill(front_color, front_rect)
     
     # Desk drawers
     drawer_width = width // 3
     drawer_height = (height - desk_top_height) // 2
-    drawer_color = (color[0] * 0.9, color[1] * 0.9, color[2] * 0.9)
+    drawer_color = _shade(color, 0.9)
     
     # Left drawer
     left_drawer = pygame.Rect(width // 10, desk_top_height + drawer_height // 4, drawer_width, drawer_height)
-    pygame.draw.rect(surface, drawer_color, left_drawer)
+    surface.fill(drawer_color, left_drawer)
     
     # Right drawer
     right_drawer = pygame.Rect(width - drawer_width - width // 10, 
                               desk_top_height + drawer_height // 4, 
                               drawer_width, drawer_height)
-    pygame.draw.rect(surface, drawer_color, right_drawer)
+    surface.fill(drawer_color, right_drawer)
     
     # Drawer handles
     handle_color = (50, 50, 50)
@@ -149,7 +255,7 @@ def create_desk(
         left_drawer.centery - handle_height // 2,
         handle_width, handle_height
     )
-    pygame.draw.rect(surface, handle_color, left_handle)
+    surface.fill(handle_color, left_handle)
     
     # Right drawer handle
     right_handle = pygame.Rect(
@@ -157,12 +263,12 @@ def create_desk(
         right_drawer.centery - handle_height // 2,
         handle_width, handle_height
     )
-    pygame.draw.rect(surface, handle_color, right_handle)
+    surface.fill(handle_color, right_handle)
     
     # Add desk items
     # Simple paper stack
     paper_rect = pygame.Rect(width // 4, height // 15, width // 5, height // 10)
-    pygame.draw.rect(surface, (240, 240, 240), paper_rect)
+    surface.fill((240, 240, 240), paper_rect)
     
     # Add outline
     pygame.draw.rect(surface, (0, 0, 0), pygame.Rect(0, 0, width, height), 2)
@@ -170,6 +276,7 @@ def create_desk(
     return surface
 
 
+@_cached_asset
 def create_floor_tile(
     size: int = 64,
     base_color: Tuple[int, int, int] = (180, 160, 140),
@@ -186,7 +293,8 @@ def create_floor_tile(
     Returns:
         A pygame Surface with the floor tile
     """
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    # Tiles are fully opaque, so they need no alpha channel
+    surface = pygame.Surface((size, size))
     
     # Base fill
     surface.fill(base_color)
@@ -201,13 +309,12 @@ def create_floor_tile(
             pygame.draw.line(surface, grain_color, (i, 0), (i, size), thickness)
             
         # Add some shorter grain lines for variation
-        for _ in range(5):
-            x = pygame.draw.line(surface, grain_color, 
-                                (grain_spacing * 2, size // 3), 
-                                (grain_spacing * 6, size // 3), 1)
-            y = pygame.draw.line(surface, grain_color, 
-                                (grain_spacing * 1, size // 2), 
-                                (grain_spacing * 4, size // 2), 1)
+        pygame.draw.line(surface, grain_color, 
+                         (grain_spacing * 2, size // 3), 
+                         (grain_spacing * 6, size // 3), 1)
+        pygame.draw.line(surface, grain_color, 
+                         (grain_spacing * 1, size // 2), 
+                         (grain_spacing * 4, size // 2), 1)
     
     elif variant == "stone":
         # Create stone texture effect
@@ -219,14 +326,14 @@ def create_floor_tile(
             for y in range(0, size, stone_size):
                 # Slightly randomize each stone's color
                 stone_color = (
-                    base_color[0] + pygame.math.Vector3(x, y, x+y).x % 20 - 10,
-                    base_color[1] + pygame.math.Vector3(x, y, x+y).y % 20 - 10,
-                    base_color[2] + pygame.math.Vector3(x, y, x+y).z % 20 - 10
+                    base_color[0] + (x % 20) - 10,
+                    base_color[1] + (y % 20) - 10,
+                    base_color[2] + ((x + y) % 20) - 10
                 )
                 
                 # Draw the stone
                 stone_rect = pygame.Rect(x + 1, y + 1, stone_size - 2, stone_size - 2)
-                pygame.draw.rect(surface, stone_color, stone_rect)
+                surface.fill(stone_color, stone_rect)
                 
         # Draw grout lines
         for x in range(0, size + 1, stone_size):
@@ -249,9 +356,9 @@ def create_floor_tile(
         for x in range(dot_spacing, size, dot_spacing):
             for y in range(dot_spacing, size, dot_spacing):
                 if (x // dot_spacing + y // dot_spacing) % 2 == 0:
-                    pygame.draw.rect(surface, pattern_color, 
-                                    pygame.Rect(x - dot_size // 2, y - dot_size // 2, 
-                                                dot_size, dot_size))
+                    surface.fill(pattern_color, 
+                                 pygame.Rect(x - dot_size // 2, y - dot_size // 2, 
+                                             dot_size, dot_size))
     
     # Add subtle border
     pygame.draw.rect(surface, (base_color[0] - 30, base_color[1] - 30, base_color[2] - 30), 
@@ -260,6 +367,7 @@ def create_floor_tile(
     return surface
 
 
+@_cached_asset
 def create_wall_tile(
     size: int = 64,
     base_color: Tuple[int, int, int] = (220, 210, 200),
@@ -276,26 +384,24 @@ def create_wall_tile(
     Returns:
         A pygame Surface with the wall tile
     """
-    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    # Tiles are fully opaque, so they need no alpha channel
+    surface = pygame.Surface((size, size))
     
     # Base fill
     surface.fill(base_color)
     
     if variant == "plain":
         # Add subtle vertical gradient for plain walls
-        lighter_color = (
-            min(255, int(base_color[0] * 1.1)),
-            min(255, int(base_color[1] * 1.1)),
-            min(255, int(base_color[2] * 1.1))
-        )
+        base = np.array(base_color[:3], dtype=np.int32)
+        lighter_color = np.minimum(255, (base * 1.1).astype(np.int32))
         
-        # Create gradient by drawing lines with decreasing alpha
-        gradient_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        for y in range(size):
-            alpha = 255 - int((y / size) * 150)  # Fade from top to bottom
-            pygame.draw.line(gradient_surface, (*lighter_color, alpha), (0, y), (size, y))
-            
-        surface.blit(gradient_surface, (0, 0))
+        # Blend the lighter color over the base with decreasing alpha, one
+        # row per pixel row, using the same integer blend as an alpha blit
+        alpha = 255 - (np.arange(size) / size * 150).astype(np.int32)  # Fade from top to bottom
+        gradient = base + (((lighter_color - base) * alpha[:, None] + lighter_color) >> 8)
+        
+        # Copy the gradient column to every pixel column at once
+        pygame.surfarray.blit_array(surface, np.broadcast_to(gradient, (size, size, 3)))
     
     elif variant == "brick":
         # Create brick pattern
@@ -305,12 +411,19 @@ def create_wall_tile(
         brick_height = size // 6
         brick_width = size // 3
         
+        # Brick shades for each variation from -15 to 14, clamped once
+        brick_shades = [
+            tuple(shade) for shade in np.clip(
+                np.array(brick_color)[None, :] + np.arange(-15, 15)[:, None], 0, 255
+            ).tolist()
+        ]
+        
         # Draw brick rows with offset
         for y in range(0, size, brick_height):
             offset = brick_width // 2 if (y // brick_height) % 2 == 1 else 0
             
             # Draw the mortar line
-            pygame.draw.rect(surface, mortar_color, pygame.Rect(0, y, size, 1))
+            surface.fill(mortar_color, pygame.Rect(0, y, size, 1))
             
             # Draw the bricks in this row
             for x in range(-offset, size, brick_width):
@@ -319,17 +432,12 @@ def create_wall_tile(
                 # Only draw if brick is at least partially visible
                 if brick_rect.right > 0 and brick_rect.left < size:
                     # Adjust the brick color slightly for variation
-                    variation = (y + x) % 30 - 15
-                    brick_shade = (
-                        max(0, min(255, brick_color[0] + variation)),
-                        max(0, min(255, brick_color[1] + variation)),
-                        max(0, min(255, brick_color[2] + variation))
-                    )
-                    pygame.draw.rect(surface, brick_shade, brick_rect)
+                    brick_shade = brick_shades[(y + x) % 30]
+                    surface.fill(brick_shade, brick_rect)
                     
                 # Draw vertical mortar between bricks
                 if x > -offset:
-                    pygame.draw.rect(surface, mortar_color, pygame.Rect(x, y, 1, brick_height))
+                    surface.fill(mortar_color, pygame.Rect(x, y, 1, brick_height))
                     
     elif variant == "wood_panel":
         # Create wood panel effect
@@ -343,8 +451,7 @@ def create_wall_tile(
         # Draw vertical panels
         for x in range(0, size, panel_width):
             # Draw panel
-            pygame.draw.rect(surface, panel_color, 
-                           pygame.Rect(x, 0, panel_width, size))
+            surface.fill(panel_color, pygame.Rect(x, 0, panel_width, size))
             
             # Add some wood grain detail
             grain_color = (panel_color[0] - 15, panel_color[1] - 15, panel_color[2] - 15)
@@ -357,8 +464,7 @@ def create_wall_tile(
             
             # Draw groove between panels
             if x > 0:
-                pygame.draw.rect(surface, groove_color, 
-                               pygame.Rect(x - 1, 0, 2, size))
+                surface.fill(groove_color, pygame.Rect(x - 1, 0, 2, size))
     
     # Add border
     pygame.draw.rect(surface, (base_color[0] - 40, base_color[1] - 40, base_color[2] - 40), 
@@ -367,6 +473,7 @@ def create_wall_tile(
     return surface
 
 
+@_cached_asset
 def create_book(
     width: int = 32,
     height: int = 40,
@@ -389,16 +496,16 @@ def create_book(
     
     # Book body
     book_rect = pygame.Rect(0, 0, width, height)
-    pygame.draw.rect(surface, color, book_rect)
+    surface.fill(color, book_rect)
     
     # Book spine
     spine_width = max(2, width // 8)
-    spine_color = (color[0] * 0.7, color[1] * 0.7, color[2] * 0.7)
+    spine_color = _shade(color, 0.7)
     spine_rect = pygame.Rect(0, 0, spine_width, height)
-    pygame.draw.rect(surface, spine_color, spine_rect)
+    surface.fill(spine_color, spine_rect)
     
     # Book cover detail - horizontal line
-    cover_line_color = (color[0] * 1.2, color[1] * 1.2, color[2] * 1.2)
+    cover_line_color = _shade(color, 1.2)
     cover_line_y = height // 3
     pygame.draw.line(surface, cover_line_color, 
                    (spine_width + 2, cover_line_y), 
@@ -406,7 +513,7 @@ def create_book(
                    1)
     
     # Book title text simulation (just a few horizontal lines)
-    text_color = (min(255, color[0] * 1.3), min(255, color[1] * 1.3), min(255, color[2] * 1.3))
+    text_color = _shade(color, 1.3)
     text_y = height // 2
     
     # Simulate a few lines of text
@@ -436,11 +543,10 @@ def save_asset(surface: pygame.Surface, filename: str, directory: str = "assets/
         bool: True if the save was successful, False otherwise
     """
     # Make sure the directory exists
-    if not os.path.exists(directory):
-        try:
-            os.makedirs(directory)
-        except OSError:
-            return False
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return False
     
     # Save the image
     full_path = os.path.join(directory, filename)
@@ -451,10 +557,38 @@ def save_asset(surface: pygame.Surface, filename: str, directory: str = "assets/
         return False
 
 
+def reset_asset_cache() -> None:
+    """
+    Discard all cached assets so they are regenerated on next use.
+    """
+    _PROTOTYPE_CACHE.clear()
+    
+    for factory in (create_bookshelf, create_desk, create_floor_tile,
+                    create_wall_tile, create_book, _shade):
+        factory.cache_clear()
+
+
 def generate_library_assets() -> Dict[str, pygame.Surface]:
     """
     Generate a set of assets for the library scene.
     
+    The assets are generated once and kept as prototypes; each call returns
+    fresh copies, which callers may modify. The copies are converted to the
+    display's pixel format when a display mode has been set.
+    
+    Returns:
+        Dictionary mapping asset names to pygame Surfaces
+    """
+    if not _PROTOTYPE_CACHE:
+        _PROTOTYPE_CACHE.update(_create_library_assets())
+    
+    return {name: _to_display_format(prototype) for name, prototype in _PROTOTYPE_CACHE.items()}
+
+
+def _create_library_assets() -> Dict[str, pygame.Surface]:
+    """
+    Create the prototype assets for the library scene.
+    
     Returns:
         Dictionary mapping asset names to pygame Surfaces
     """
@@ -499,6 +633,12 @@ def save_library_assets(directory: str = "assets/images") -> None:
     # Generate assets
     assets = generate_library_assets()
     
-    # Save assets
-    for name, surface in assets.items():
-        save_asset(surface, f"{name}.png", directory)
\ No newline at end of file
+    # Create the directory once before saving in parallel
+    os.makedirs(directory, exist_ok=True)
+    
+    # Save assets; PNG encoding runs in C, so the saves can overlap
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(
+            lambda item: save_asset(item[1], f"{item[0]}.png", directory),
+            assets.items()
+        ))
\ No newline at end of file